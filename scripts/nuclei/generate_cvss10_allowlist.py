@@ -15,10 +15,75 @@ Output:
 from __future__ import annotations
 
 import argparse
+import mmap
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-CVSS_RE = re.compile(r"^\s*cvss-score\s*:\s*(10(?:\.0+)?)\s*$", re.IGNORECASE | re.MULTILINE)
+# Module-level so forked pool workers inherit the compiled pattern; spawn-based
+# platforms (Windows) re-import the module and recompile on their own.
+# Bytes-mode so we can run it straight over an mmap without decoding the file.
+CVSS_RE = re.compile(rb"^\s*cvss-score\s*:\s*(10(?:\.0+)?)\s*$", re.IGNORECASE | re.MULTILINE)
+NEEDLE = b"cvss-score"
+# Case-insensitive fallback for the literal gate so it can never drop a
+# template that CVSS_RE (IGNORECASE) would match.
+NEEDLE_RE = re.compile(rb"cvss-score", re.IGNORECASE)
+
+
+# Only http/cves/** is ever selected, so those are the only descents allowed
+# in the first two levels; the huge sibling subtrees (code/, file/, network/,
+# dns/, headless/, ...) are never even listed.
+_ALLOWED_DESCENTS = {("", "http"), ("http/", "cves")}
+
+
+def _walk(root_str: str, prefix: str):
+    """Yield (rel, abs) for every .yaml via os.scandir — no Path objects, one
+    getdents per directory instead of a stat per file."""
+    with os.scandir(root_str) as it:
+        for e in it:
+            if e.is_dir(follow_symlinks=False):
+                if prefix in ("", "http/") and (prefix, e.name) not in _ALLOWED_DESCENTS:
+                    continue
+                yield from _walk(e.path, prefix + e.name + "/")
+            elif e.name.endswith(".yaml"):
+                yield prefix + e.name, e.path
+
+
+def _filter_candidates(root: Path) -> list[tuple[str, str]]:
+    """Cheap path-prefix pass: return (rel, abs) pairs worth reading."""
+    candidates: list[tuple[str, str]] = []
+    for rel, abs_path in _walk(str(root), ""):
+        # Path filters: keep it tight and web-first.
+        if not rel.startswith("http/cves/"):
+            continue
+        if "/headless/" in rel:
+            continue
+        candidates.append((rel, abs_path))
+    return candidates
+
+
+def _scan_one(item: tuple[str, str]) -> str | None:
+    rel, abs_path = item
+    try:
+        with open(abs_path, "rb") as f:
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                # memchr-speed literal check first; the vast majority of
+                # templates don't mention cvss-score at all. Non-lowercase
+                # spellings fall back to the case-insensitive literal regex.
+                if mm.find(NEEDLE) == -1 and not NEEDLE_RE.search(mm):
+                    return None
+                if not CVSS_RE.search(mm):
+                    return None
+            finally:
+                mm.close()
+    except (OSError, ValueError):
+        # ValueError: empty file cannot be mmapped.
+        return None
+    return rel
 
 
 def main() -> None:
@@ -33,28 +98,11 @@ def main() -> None:
     if not root.exists():
         raise SystemExit(f"templates root not found: {root}")
 
-    selected: list[str] = []
-
-    for p in root.rglob("*.yaml"):
-        rel = p.relative_to(root).as_posix()
-
-        # Path filters: keep it tight and web-first.
-        if not rel.startswith("http/cves/"):
-            continue
-        if "/headless/" in rel or rel.startswith("headless/"):
-            continue
-        if rel.startswith("code/") or rel.startswith("file/") or rel.startswith("network/") or rel.startswith("ssl/"):
-            continue
-
-        try:
-            s = p.read_text(encoding="utf-8", errors="ignore")
-        except Exception:
-            continue
-
-        if not CVSS_RE.search(s):
-            continue
+    candidates = _filter_candidates(root)
 
-        selected.append(rel)
+    # The read+regex pass dominates; fan it out across cores.
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+        selected = [r for r in ex.map(_scan_one, candidates, chunksize=64) if r]
 
     selected = sorted(set(selected))
     out_path.parent.mkdir(parents=True, exist_ok=True)
@@ -1,14 +1,86 @@
 #!/usr/bin/env python3
+import heapq
+import mmap
+import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
 # Very lightweight JS/HTML token extraction.
 # - endpoints: things like /api/v1/users, /v1/login, /.well-known/openid-configuration
 # - params: query param keys from ?a=b&c=d and from common patterns
 
-ENDPOINT_RE = re.compile(r"(?<![A-Za-z0-9_])(/(?:[A-Za-z0-9._~\-]|%[0-9A-Fa-f]{2}){1,64}(?:/(?:[A-Za-z0-9._~\-]|%[0-9A-Fa-f]{2}){1,64}){0,6})(?![A-Za-z0-9_])")
-PARAM_RE = re.compile(r"[?&]([A-Za-z_][A-Za-z0-9_\-]{1,60})=")
+# Bytes-mode (ASCII-only classes) so the regex can scan an mmap directly,
+# with no utf-8 decode pass and no full-file str allocation.
+# Each path segment sits in an atomic group (?>...) — Python 3.11+ — so the
+# engine never re-splits segments while backtracking; minified/adversarial JS
+# can otherwise push the nested quantifiers superlinear.
+ENDPOINT_RE = re.compile(rb"(?<![A-Za-z0-9_])(/(?>(?:[A-Za-z0-9._~\-]|%[0-9A-Fa-f]{2}){1,64})(?:/(?>(?:[A-Za-z0-9._~\-]|%[0-9A-Fa-f]{2}){1,64})){0,6})(?![A-Za-z0-9_])")
+# Param-name body, applied only right after a literal '?'/'&' anchor (see _scan_params).
+PARAM_NAME_RE = re.compile(rb"[A-Za-z_][A-Za-z0-9_\-]{1,60}=")
+
+_EXTS = {'js', 'mjs', 'cjs', 'html'}
+
+
+def _walk(d):
+    # os.scandir recursion: one getdents per directory, dirent-level type
+    # checks, and plain str paths — no per-file Path/stat overhead.
+    with os.scandir(d) as it:
+        for e in it:
+            if e.is_dir(follow_symlinks=False):
+                yield from _walk(e.path)
+            elif e.is_file(follow_symlinks=False):
+                n = e.name
+                dot = n.rfind('.')
+                if dot > 0 and n[dot + 1:].lower() in _EXTS:
+                    yield e.path
+
+
+def _scan_params(buf, out):
+    # Hunt the '?'/'&' anchors with bytes.find (memchr) and only run the tiny
+    # anchored name regex at those positions, instead of NFA-scanning the
+    # whole buffer with [?&](...)=.
+    i = 0
+    n = len(buf)
+    while i < n:
+        j = buf.find(b"?", i)
+        k = buf.find(b"&", i)
+        if j == -1:
+            pos = k
+        elif k == -1:
+            pos = j
+        else:
+            pos = min(j, k)
+        if pos == -1:
+            break
+        m = PARAM_NAME_RE.match(buf, pos + 1)
+        if m:
+            out.add(m.group()[:-1].decode())
+        i = pos + 1
+
+
+def _scan_file(kind, path):
+    out = set()
+    try:
+        with open(path, 'rb') as fh:
+            if fh.seek(0, 2) == 0:  # mmap rejects empty files
+                return out
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+    except Exception:
+        return out
+    try:
+        if kind == 'endpoints':
+            for m in ENDPOINT_RE.finditer(mm):
+                ep = m.group(1)
+                if len(ep) <= 140:
+                    out.add(ep.decode('ascii', 'ignore'))
+        else:
+            _scan_params(mm, out)
+    finally:
+        mm.close()
+    return sorted(out)
 
 
 def main():
@@ -17,36 +89,28 @@ def main():
         return 2
 
     kind = sys.argv[1]
+    if kind not in ('endpoints', 'params'):
+        print("kind must be endpoints|params", file=sys.stderr)
+        return 2
     root = Path(sys.argv[2])
-    files = []
     if root.is_dir():
-        for p in root.rglob('*'):
-            if p.is_file() and p.suffix.lower() in ('.js', '.mjs', '.cjs', '.html'):
-                files.append(p)
+        files = list(_walk(str(root)))
     else:
-        files = [root]
-
-    out = set()
-    for f in files:
-        try:
-            txt = f.read_text(encoding='utf-8', errors='ignore')
-        except Exception:
-            continue
+        files = [str(root)]
 
-        if kind == 'endpoints':
-            for m in ENDPOINT_RE.finditer(txt):
-                ep = m.group(1)
-                if len(ep) <= 140:
-                    out.add(ep)
-        elif kind == 'params':
-            for m in PARAM_RE.finditer(txt):
-                out.add(m.group(1))
-        else:
-            print("kind must be endpoints|params", file=sys.stderr)
-            return 2
+    # Threads are enough here: the open/mmap syscalls and bytes-mode regex
+    # matching both release the GIL. Workers return sorted-unique lists so
+    # the reducer can heap-merge and dedupe while streaming to stdout,
+    # instead of building one global set and re-sorting it.
+    workers = min(32, (os.cpu_count() or 4) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        partials = list(ex.map(partial(_scan_file, kind), files, chunksize=16))
 
-    for t in sorted(out):
-        print(t)
+    prev = None
+    for t in heapq.merge(*partials):
+        if t != prev:
+            print(t)
+            prev = t
     return 0
 
 
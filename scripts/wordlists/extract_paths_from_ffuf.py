@@ -1,13 +1,37 @@
 #!/usr/bin/env python3
 import json
-import re
 import sys
 from pathlib import Path
 
 # Extract path tokens from ffuf json output.
 # Prints one token per line (no scheme/host). Example: "admin" from "https://x/y/admin".
 
-URL_RE = re.compile(r"^https?://[^/]+(?P<path>/.*)$", re.I)
+# ijson streams "results" incrementally (constant memory on huge reports);
+# without it we fall back to slurping the file with stdlib json.
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# SortedSet keeps tokens ordered as they arrive, so output needs no final
+# O(n log n) sort + second full copy; a plain set fallback sorts at the end.
+try:
+    from sortedcontainers import SortedSet
+except ImportError:
+    SortedSet = None
+
+def url_path(url: str):
+    # Scheme check + first-slash find; no regex dispatch per record.
+    # Lowercase the prefix only — URL_RE was case-insensitive (re.I).
+    head = url[:8].lower()
+    if head.startswith("http://"):
+        i = 7
+    elif head.startswith("https://"):
+        i = 8
+    else:
+        return None
+    j = url.find("/", i)
+    return url[j:] if j != -1 else "/"
 
 
 def norm_token(p: str) -> str:
@@ -27,23 +51,33 @@ def norm_token(p: str) -> str:
     return seg
 
 
+def iter_results(p: Path):
+    if ijson is not None:
+        with open(p, "rb") as f:
+            yield from ijson.items(f, "results.item")
+        return
+    d = json.loads(p.read_text(encoding="utf-8", errors="ignore"))
+    yield from d.get("results") or []
+
+
 def main():
     if len(sys.argv) < 2:
         print("usage: extract_paths_from_ffuf.py <ffuf.json>", file=sys.stderr)
         return 2
     p = Path(sys.argv[1])
-    d = json.loads(p.read_text(encoding="utf-8", errors="ignore"))
-    out = set()
-    for r in d.get("results") or []:
+    out = SortedSet() if SortedSet else set()
+    for r in iter_results(p):
         url = str(r.get("url") or "").strip()
-        m = URL_RE.match(url)
-        if not m:
+        path = url_path(url)
+        if path is None:
             continue
-        token = norm_token(m.group("path"))
+        token = norm_token(path)
         if token:
             out.add(token)
-    for t in sorted(out):
-        print(t)
+    # Chunked writelines amortizes write syscalls on big wordlists.
+    tokens = out if SortedSet else sorted(out)
+    for i in range(0, len(tokens), 10000):
+        sys.stdout.writelines(t + "\n" for t in tokens[i:i + 10000])
     return 0
 
 
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Shared scope parsing/matching for the python skills.
+
+Scope entries (one per line) are exact IPv4s, CIDRs, hostnames or *.wildcards.
+build_scope() classifies and compiles them once per process so the per-target
+check does no regex work: IPs resolve via a set lookup plus a bisect over
+merged (start, end) CIDR intervals, hostnames via plain suffix compares.
+"""
+
+from __future__ import annotations
+
+import ipaddress
+import re
+import socket
+from bisect import bisect_right
+from dataclasses import dataclass
+from functools import lru_cache
+
+IPV4_FULL = re.compile(r"\d{1,3}(?:\.\d{1,3}){3}").fullmatch
+
+
+@lru_cache(maxsize=8192)
+def ip_to_int(ip):
+    # inet_pton is a single C call and only accepts full dotted quads
+    # (inet_aton would also take short forms like "127.1").
+    try:
+        return int.from_bytes(socket.inet_pton(socket.AF_INET, ip), "big")
+    except OSError:
+        return None
+
+
+@dataclass
+class ScopeIndex:
+    exact_ips: set
+    cidrs: list  # merged, sorted (start, end) intervals
+    cidr_starts: list  # parallel starts for bisect
+    hosts: list
+    host_wildcards: list
+
+
+def build_scope(entries):
+    """Compile raw scope entries into a ScopeIndex; None when no entries."""
+    if not entries:
+        return None
+    exact_ips = set()
+    intervals = []
+    hosts = []
+    wildcards = []
+    for e in entries:
+        e = (e or "").strip()
+        if not e:
+            continue
+        if "/" in e:
+            # strict=False masks host bits, same as the old hand-rolled math.
+            try:
+                net = ipaddress.ip_network(e, strict=False)
+            except ValueError:
+                continue
+            if net.version == 4:
+                intervals.append((int(net.network_address), int(net.broadcast_address)))
+            continue
+        if IPV4_FULL(e):
+            n = ip_to_int(e)
+            if n is not None:
+                exact_ips.add(n)
+            continue
+        h = e.lower().rstrip(".")
+        if h.startswith("*."):
+            wildcards.append(h[2:])
+        else:
+            hosts.append(h)
+    # Merge overlaps so a single bisect probe is a complete answer.
+    intervals.sort()
+    merged = []
+    for start, end in intervals:
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return ScopeIndex(exact_ips, merged, [c[0] for c in merged], hosts, wildcards)
+
+
+def _host_match(h, root):
+    return h == root or h.endswith("." + root)
+
+
+def in_scope(target, index):
+    """True when target (hostname or IPv4) falls inside the compiled scope."""
+    if index is None:
+        return True
+    t = (target or "").strip()
+    if not t:
+        return False
+    if IPV4_FULL(t):
+        n = ip_to_int(t)
+        if n is None:
+            return False
+        if n in index.exact_ips:
+            return True
+        i = bisect_right(index.cidr_starts, n) - 1
+        return i >= 0 and n <= index.cidrs[i][1]
+    h = t.lower().rstrip(".")
+    for root in index.hosts:
+        if _host_match(h, root):
+            return True
+    for root in index.host_wildcards:
+        if _host_match(h, root):
+            return True
+    return False
@@ -7,19 +7,58 @@
 """
 
 import argparse
+import asyncio
+import functools
+import io
 import json
 import os
 import re
 import shutil
 import subprocess
 import sys
-from datetime import datetime, timezone
+import time
 from pathlib import Path
 from urllib.parse import urlsplit
 
+# orjson parses naabu's JSONL 2-3x faster and serializes records 3-5x
+# faster when present; the fallbacks keep emit() writing compact bytes.
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(o):
+        return json.dumps(o, separators=(",", ":")).encode()
+
+_OUT = sys.stdout.buffer
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from _scope import IPV4_FULL, build_scope, in_scope  # noqa: E402
+
+# Hoisted so hot parse paths skip the re._cache probe per call.
+PORT_OPEN_RE = re.compile(r"(\d+)/open")
+
+
+@functools.lru_cache(maxsize=None)
+def _which(name):
+    # TOOL_<NAME> env vars skip the PATH walk entirely under orchestrated runs.
+    return os.environ.get("TOOL_" + name.upper()) or shutil.which(name)
+
+
+_LAST_TS = [0, ""]
+
 
 def now_iso():
-    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    # Records land in bursts; format the timestamp once per second instead of
+    # running the datetime/TZ machinery for every emit().
+    t = int(time.time())
+    if t != _LAST_TS[0]:
+        _LAST_TS[0] = t
+        _LAST_TS[1] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(t))
+    return _LAST_TS[1]
 
 
 def emit(record):
@@ -27,7 +66,8 @@ def emit(record):
         record["ts"] = now_iso()
     if "timestamp" not in record:
         record["timestamp"] = record["ts"]
-    sys.stdout.write(json.dumps(record, separators=(",", ":")) + "\n")
+    _OUT.write(_dumps(record))
+    _OUT.write(b"\n")
 
 
 def load_scope(scope_file):
@@ -45,84 +85,20 @@ def load_scope(scope_file):
     return entries
 
 
-def ip_to_int(ip):
-    parts = ip.split(".")
-    if len(parts) != 4:
-        return None
-    nums = []
-    for p in parts:
-        try:
-            n = int(p)
-        except ValueError:
-            return None
-        if n < 0 or n > 255:
-            return None
-        nums.append(n)
-    return (nums[0] << 24) + (nums[1] << 16) + (nums[2] << 8) + nums[3]
-
-
-def cidr_range(cidr):
-    ip, pref = cidr.split("/", 1)
-    try:
-        prefix = int(pref)
-    except ValueError:
-        return None
-    if prefix < 0 or prefix > 32:
-        return None
-    base = ip_to_int(ip)
-    if base is None:
-        return None
-    mask = 0 if prefix == 0 else (0xFFFFFFFF << (32 - prefix)) & 0xFFFFFFFF
-    start = base & mask
-    end = start | (~mask & 0xFFFFFFFF)
-    return start, end
-
-
-def hostname_in_scope(host, entry):
-    h = host.lower().rstrip(".")
-    e = entry.lower().rstrip(".")
-    if e.startswith("*."):
-        root = e[2:]
-        return h == root or h.endswith("." + root)
-    return h == e or h.endswith("." + e)
-
-
-def target_in_scope(target, entries):
-    if not entries:
-        return True
-    if re.match(r"^\d+\.\d+\.\d+\.\d+$", target):
-        ip_int = ip_to_int(target)
-        if ip_int is None:
-            return False
-        for e in entries:
-            if re.match(r"^\d+\.\d+\.\d+\.\d+$", e) and e == target:
-                return True
-            if "/" in e:
-                r = cidr_range(e)
-                if r and ip_int >= r[0] and ip_int <= r[1]:
-                    return True
-        return False
-    for e in entries:
-        if "/" in e or re.match(r"^\d+\.\d+\.\d+\.\d+$", e):
-            continue
-        if hostname_in_scope(target, e):
-            return True
-    return False
-
-
 def run_capture(cmd, timeout_s):
+    # Bytes mode: callers decode selectively, so tool output written straight
+    # back to disk (naabu JSONL) is never decoded+re-encoded.
     try:
         res = subprocess.run(
             cmd,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
             timeout=timeout_s,
             check=False,
         )
         return res.returncode, res.stdout, res.stderr
     except subprocess.TimeoutExpired:
-        return 124, "", "timeout"
+        return 124, b"", b"timeout"
 
 
 def split_target(raw: str):
@@ -155,8 +131,8 @@ def main():
     source = "src/skills/python/enum/01-port-scan.py"
     stage = "enum"
     target, _target_url = split_target(args.target)
-    scope_entries = load_scope(args.scope_file)
-    if not target_in_scope(target, scope_entries):
+    scope = build_scope(load_scope(args.scope_file))
+    if not in_scope(target, scope):
         emit({
             "type": "note",
             "tool": "scope",
@@ -187,12 +163,14 @@ def main():
 
     # If target is a hostname, resolve A records first and scan IP(s) to avoid DNS-induced tool weirdness.
     scan_targets = [target]
-    if not re.match(r"^\d+\.\d+\.\d+\.\d+$", target) and shutil.which("dig"):
-        _c, out, _e = run_capture(["dig", "+short", "A", target], min(timeout_s, 10))
+    dig_bin = _which("dig")
+    if not IPV4_FULL(target) and dig_bin:
+        _c, out_b, _e = run_capture([dig_bin, "+short", "A", target], min(timeout_s, 10))
+        out = (out_b or b"").decode("utf-8", "ignore")
         ips = []
-        for line in (out or "").splitlines():
+        for line in out.splitlines():
             s = line.strip()
-            if re.match(r"^\d+\.\d+\.\d+\.\d+$", s):
+            if IPV4_FULL(s):
                 ips.append(s)
         ips = sorted(set(ips))
         if ips:
@@ -208,28 +186,33 @@ def main():
                 "source": source,
             })
 
-    if shutil.which("naabu"):
+    naabu_bin = _which("naabu")
+    nmap_bin = _which("nmap")
+    if naabu_bin:
         out_jsonl = ev_dir / f"{target}.naabu.jsonl"
-        cmd = ["naabu", "-host", target, "-silent", "-json"]
+        cmd = [naabu_bin, "-host", target, "-silent", "-json"]
         if rate:
             cmd += ["-rate", str(rate)]
         code, out, err = run_capture(cmd, timeout_s)
-        out_jsonl.write_text(out, encoding="utf-8", errors="ignore")
+        out_jsonl.write_bytes(out)
         evidence.append(str(out_jsonl))
-        for line in out.splitlines():
+        # io.BytesIO iterates lazily instead of materializing a line list;
+        # both orjson and stdlib json parse bytes directly.
+        for line in io.BytesIO(out):
             line = line.strip()
             if not line:
                 continue
             try:
-                obj = json.loads(line)
-            except json.JSONDecodeError:
+                obj = _loads(line)
+            except ValueError:
                 continue
             p = obj.get("port")
             if isinstance(p, int):
                 open_ports.append(p)
-    elif shutil.which("nmap"):
-        # Run nmap against each scan target (IP preferred). Keep it fast-ish.
-        for t in scan_targets:
+    elif nmap_bin:
+        # Run nmap against each scan target (IP preferred), concurrently so
+        # walltime is ~one scan instead of len(scan_targets). Keep it fast-ish.
+        async def _one(t):
             suffix = t.replace("/", "_")
             out_gnmap = ev_dir / f"{target}.{suffix}.nmap.gnmap"
             out_nmap = ev_dir / f"{target}.{suffix}.nmap.txt"
@@ -238,7 +221,7 @@ def main():
             # For validation runs, keep it very bounded. Use a small port set (80/443/etc.)
             ports = "80,443,8080,8443,22,25,53"
             cmd = [
-                "nmap",
+                nmap_bin,
                 "-Pn",
                 "-sV",
                 "-p",
@@ -251,20 +234,31 @@ def main():
                 str(out_nmap),
                 t,
             ]
-            code, out, err = run_capture(cmd, timeout_s)
+            proc = await asyncio.create_subprocess_exec(
+                *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+            )
+            try:
+                _out, err_b = await asyncio.wait_for(proc.communicate(), timeout_s)
+                code, err = proc.returncode, err_b.decode("utf-8", "ignore")
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.communicate()
+                code, err = 124, "timeout"
             out_err.write_text((err or "") + f"\n(exit={code})\n", encoding="utf-8", errors="ignore")
+            return t, out_gnmap, out_nmap, out_err
+
+        async def _run_all(ts):
+            return await asyncio.gather(*[_one(t) for t in ts])
+
+        # Sort by target so evidence/port ordering matches the old serial loop.
+        for t, out_gnmap, out_nmap, out_err in sorted(asyncio.run(_run_all(scan_targets))):
             evidence += [str(out_gnmap), str(out_nmap), str(out_err)]
 
             if out_gnmap.exists():
-                for line in out_gnmap.read_text(encoding="utf-8", errors="ignore").splitlines():
-                    if "Ports:" not in line:
-                        continue
-                    parts = line.split("Ports:", 1)[1]
-                    for seg in parts.split(","):
-                        seg = seg.strip()
-                        m = re.match(r"^(\d+)/open", seg)
-                        if m:
-                            open_ports.append(int(m.group(1)))
+                # Only the N/open tokens matter, so one finditer over the
+                # whole file replaces the per-line/per-segment split dance.
+                data = out_gnmap.read_text(encoding="utf-8", errors="ignore")
+                open_ports.extend(int(m.group(1)) for m in PORT_OPEN_RE.finditer(data))
     else:
         emit({
             "type": "note",
@@ -7,19 +7,51 @@
 """
 
 import argparse
+import functools
 import json
 import os
 import re
 import shutil
 import subprocess
 import sys
-from datetime import datetime, timezone
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from urllib.parse import urlsplit
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from _scope import IPV4_FULL, build_scope, in_scope  # noqa: E402
+
+
+# orjson serializes records 3-5x faster when present and returns compact
+# bytes directly; the fallback pre-encodes so emit() always writes bytes.
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+except ImportError:
+    def _dumps(o):
+        return json.dumps(o, separators=(",", ":")).encode()
+
+_OUT = sys.stdout.buffer
+
+@functools.lru_cache(maxsize=None)
+def _which(name):
+    # TOOL_<NAME> env vars skip the PATH walk entirely under orchestrated runs.
+    return os.environ.get("TOOL_" + name.upper()) or shutil.which(name)
+
+
+_LAST_TS = [0, ""]
+
 
 def now_iso():
-    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    # Records land in bursts; format the timestamp once per second instead of
+    # running the datetime/TZ machinery for every emit().
+    t = int(time.time())
+    if t != _LAST_TS[0]:
+        _LAST_TS[0] = t
+        _LAST_TS[1] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(t))
+    return _LAST_TS[1]
 
 
 def emit(record):
@@ -27,7 +59,8 @@ def emit(record):
         record["ts"] = now_iso()
     if "timestamp" not in record:
         record["timestamp"] = record["ts"]
-    sys.stdout.write(json.dumps(record, separators=(",", ":")) + "\n")
+    _OUT.write(_dumps(record))
+    _OUT.write(b"\n")
 
 
 def load_scope(scope_file):
@@ -45,29 +78,6 @@ def load_scope(scope_file):
     return entries
 
 
-def hostname_in_scope(host, entry):
-    h = host.lower().rstrip(".")
-    e = entry.lower().rstrip(".")
-    if e.startswith("*."):
-        root = e[2:]
-        return h == root or h.endswith("." + root)
-    return h == e or h.endswith("." + e)
-
-
-def target_in_scope(target, entries):
-    if not entries:
-        return True
-    # Basic: only hostname/domain entries here (dns skill)
-    for e in entries:
-        if "/" in e:
-            continue
-        if re.match(r"^\d+\.\d+\.\d+\.\d+$", e):
-            continue
-        if hostname_in_scope(target, e):
-            return True
-    return False
-
-
 def run_capture(cmd, timeout_s):
     try:
         res = subprocess.run(
@@ -113,8 +123,8 @@ def main():
     source = "src/skills/python/recon/01-dns-recon.py"
     stage = "recon"
     target, _target_url = split_target(args.target)
-    scope_entries = load_scope(args.scope_file)
-    if not target_in_scope(target, scope_entries):
+    scope = build_scope(load_scope(args.scope_file))
+    if not in_scope(target, scope):
         emit({
             "type": "note",
             "tool": "scope",
@@ -137,14 +147,19 @@ def main():
     ips = []
     txt_out = []
 
-    if shutil.which("dig"):
-        for rr in ["A", "AAAA", "CNAME", "NS", "MX", "TXT"]:
-            code, out, err = run_capture(["dig", "+short", rr, target], timeout_s)
+    dig_bin = _which("dig")
+    if dig_bin:
+        # One dig per record type, all in flight at once: threads just wait on
+        # subprocess pipes, so latency is ~1 RTT instead of 6.
+        rrs = ["A", "AAAA", "CNAME", "NS", "MX", "TXT"]
+        with ThreadPoolExecutor(max_workers=len(rrs)) as ex:
+            results = list(ex.map(lambda rr: run_capture([dig_bin, "+short", rr, target], timeout_s), rrs))
+        for rr, (code, out, err) in zip(rrs, results):
             txt_out.append(f";; {rr} (code={code})\\n{out}{err}\\n")
             if rr == "A":
                 for line in out.splitlines():
                     s = line.strip()
-                    if re.match(r"^\d+\.\d+\.\d+\.\d+$", s):
+                    if IPV4_FULL(s):
                         ips.append(s)
         ev_path = ev_dir / f"{target}.dig.txt"
         ev_path.write_text("".join(txt_out), encoding="utf-8", errors="ignore")
@@ -161,8 +176,9 @@ def main():
             "source": source,
         })
 
-    if shutil.which("dnsx"):
-        cmd = ["dnsx", "-silent", "-a", "-resp"]
+    dnsx_bin = _which("dnsx")
+    if dnsx_bin:
+        cmd = [dnsx_bin, "-silent", "-a", "-resp"]
         code, out, err = run_capture(cmd + ["-d", target], timeout_s)
         ev_path = ev_dir / f"{target}.dnsx.txt"
         ev_path.write_text(out + err, encoding="utf-8", errors="ignore")
@@ -10,12 +10,33 @@ import argparse
 import json
 import os
 import sys
-from datetime import datetime, timezone
+import time
 from pathlib import Path
 
 
+# orjson serializes records 3-5x faster when present and returns compact
+# bytes directly; the fallback pre-encodes so emit() always writes bytes.
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+except ImportError:
+    def _dumps(o):
+        return json.dumps(o, separators=(",", ":")).encode()
+
+_OUT = sys.stdout.buffer
+
+_LAST_TS = [0, ""]
+
+
 def now_iso():
-    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    # Records land in bursts; format the timestamp once per second instead of
+    # running the datetime/TZ machinery for every emit().
+    t = int(time.time())
+    if t != _LAST_TS[0]:
+        _LAST_TS[0] = t
+        _LAST_TS[1] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(t))
+    return _LAST_TS[1]
 
 
 def emit(record):
@@ -23,7 +44,8 @@ def emit(record):
         record["ts"] = now_iso()
     if "timestamp" not in record:
         record["timestamp"] = record["ts"]
-    sys.stdout.write(json.dumps(record, separators=(",", ":")) + "\n")
+    _OUT.write(_dumps(record))
+    _OUT.write(b"\n")
 
 
 def main():